@@ -10,92 +10,170 @@ For example:
 - etc.
 """
 
+import errno
 import os
 import shutil
-
-def organize_files(folder_path):
+from concurrent.futures import ThreadPoolExecutor
+
+# This dictionary maps folder names to the file extensions that go in them
+# You can add more categories here!
+file_categories = {
+    'Images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg'],
+    'Documents': ['.pdf', '.doc', '.docx', '.txt', '.xlsx', '.pptx'],
+    'Videos': ['.mp4', '.avi', '.mov', '.mkv'],
+    'Music': ['.mp3', '.wav', '.flac', '.m4a'],
+    'Archives': ['.zip', '.rar', '.7z', '.tar', '.gz'],
+    'Code': ['.py', '.js', '.html', '.css', '.java', '.cpp']
+}
+
+# The same information flipped around: extension -> folder name.
+# Built once when the script loads, so finding a file's category is a
+# single dictionary lookup instead of searching every category's list.
+EXT_TO_CATEGORY = {
+    extension: category
+    for category, extensions in file_categories.items()
+    for extension in extensions
+}
+
+def organize_files(folder_path, max_workers=8):
     """
     Organizes files in the given folder by their type.
 
     Args:
         folder_path: The path to the folder you want to organize
+        max_workers: How many files to move at the same time (default 8).
+            Use 1 to move files one after another.
     """
 
-    # This dictionary maps file extensions to folder names
-    # You can add more categories here!
-    file_categories = {
-        'Images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg'],
-        'Documents': ['.pdf', '.doc', '.docx', '.txt', '.xlsx', '.pptx'],
-        'Videos': ['.mp4', '.avi', '.mov', '.mkv'],
-        'Music': ['.mp3', '.wav', '.flac', '.m4a'],
-        'Archives': ['.zip', '.rar', '.7z', '.tar', '.gz'],
-        'Code': ['.py', '.js', '.html', '.css', '.java', '.cpp']
-    }
-
     # Check if the folder exists
     if not os.path.exists(folder_path):
         print(f"Error: The folder '{folder_path}' doesn't exist!")
         return
 
+    # Check we were asked to move at least one file at a time
+    # (done before anything on disk is touched)
+    if max_workers < 1:
+        print(f"Error: max_workers must be at least 1 (got {max_workers})")
+        return
+
     print(f"Starting to organize files in: {folder_path}")
     print("-" * 50)
 
     # Counter to track how many files we moved
     files_moved = 0
 
-    # Loop through all items in the folder
-    for filename in os.listdir(folder_path):
-        # Get the full path of the file
-        file_path = os.path.join(folder_path, filename)
-
-        # Skip if it's a folder (we only want to organize files)
-        if os.path.isdir(file_path):
-            continue
-
-        # Get the file extension (like .jpg, .pdf, etc.)
-        _, file_extension = os.path.splitext(filename)
-        file_extension = file_extension.lower()  # Make it lowercase for comparison
-
-        # Find which category this file belongs to
-        moved = False
-        for category, extensions in file_categories.items():
-            if file_extension in extensions:
-                # Create the category folder if it doesn't exist
-                category_path = os.path.join(folder_path, category)
-                if not os.path.exists(category_path):
+    # Work out every category folder's full path up front
+    # (files we don't recognize go into "Other")
+    dest_dirs = {
+        category: os.path.join(folder_path, category)
+        for category in [*file_categories, 'Other']
+    }
+
+    # Remember which category folders we've already made sure exist,
+    # so we only touch the disk once per category instead of once per file
+    created_folders = set()
+
+    # Step 1: Decide where every file should go.
+    # We collect (filename, category, from, to) for each file that needs
+    # moving, and only move them once we've looked at the whole folder.
+    planned_moves = []
+
+    # Loop through all items in the folder.
+    # os.scandir gives us each entry's name, path and type in one go,
+    # which saves an extra disk lookup per file compared to os.listdir.
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            filename = entry.name
+            file_path = entry.path
+
+            # Skip if it's a folder (we only want to organize files)
+            # Shortcuts (symlinks) to folders count as folders too
+            if entry.is_dir():
+                continue
+
+            # Get the file extension (like .jpg, .pdf, etc.)
+            # Files without a dot (like "README") have no extension
+            base, dot, extension = filename.rpartition('.')
+            if dot and base.strip('.'):
+                file_extension = '.' + extension.lower()  # Lowercase for comparison
+            else:
+                file_extension = ''
+
+            # Find which category this file belongs to
+            # If we don't recognize the extension, it goes into "Other"
+            category = EXT_TO_CATEGORY.get(file_extension, 'Other')
+            category_path = dest_dirs[category]
+
+            # Create the category folder if it doesn't exist
+            # (done here, before any moves start, so two moves never race
+            # to create the same folder)
+            if category_path not in created_folders:
+                # Just try to create it; if the folder is already there that's
+                # fine (this saves checking whether it exists first).
+                # But a *file* with the category's name is a real problem.
+                try:
                     os.makedirs(category_path)
                     print(f"Created folder: {category}")
-
-                # Move the file into the category folder
-                destination = os.path.join(category_path, filename)
-
-                # Check if file already exists at destination
-                if os.path.exists(destination):
-                    print(f"⚠️  Skipped '{filename}' (already exists in {category})")
-                else:
-                    shutil.move(file_path, destination)
-                    print(f"✓ Moved '{filename}' → {category}/")
-                    files_moved += 1
-
-                moved = True
-                break
-
-        # If we didn't find a category, move to "Other"
-        if not moved:
-            other_path = os.path.join(folder_path, 'Other')
-            if not os.path.exists(other_path):
-                os.makedirs(other_path)
-                print(f"Created folder: Other")
-
-            destination = os.path.join(other_path, filename)
-            if not os.path.exists(destination):
+                except FileExistsError:
+                    if not os.path.isdir(category_path):
+                        raise
+                created_folders.add(category_path)
+
+            destination = os.path.join(category_path, filename)
+
+            # Check if file already exists at destination
+            # Every file in a folder has a unique name, so no two planned
+            # moves can ever end up at the same destination.
+            if os.path.exists(destination):
+                print(f"⚠️  Skipped '{filename}' (already exists in {category})")
+            else:
+                planned_moves.append((filename, category, file_path, destination))
+
+    # Step 2: Move the files.
+    # Moving a file mostly means waiting on the disk, so we let several
+    # threads do it at once; that's much faster on slow or network drives.
+    def move_file(move):
+        """Moves one planned file. Returns (move, error); error is None if it worked."""
+        _, _, file_path, destination = move
+        try:
+            try:
+                # The category folders live inside folder_path, so this is
+                # normally a simple rename on the same drive (one quick step)
+                os.replace(file_path, destination)
+            except OSError as error:
+                # Only if the category folder is on a different drive, fall
+                # back to shutil.move, which copies the file across instead.
+                # Any other problem is a real failure, so pass it on.
+                if error.errno != errno.EXDEV:
+                    raise
                 shutil.move(file_path, destination)
-                print(f"✓ Moved '{filename}' → Other/")
+        except OSError as error:
+            # Don't stop here - the other moves keep going, and we report
+            # this one as failed below
+            return move, error
+        return move, None
+
+    # Keep track of files that couldn't be moved so we can list them at the end
+    failed_moves = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for (filename, category, _, _), error in executor.map(move_file, planned_moves):
+            if error is None:
+                print(f"✓ Moved '{filename}' → {category}/")
                 files_moved += 1
+            else:
+                print(f"❌ Failed to move '{filename}' → {category}/: {error}")
+                failed_moves.append(filename)
 
     print("-" * 50)
     print(f"Done! Organized {files_moved} files.")
 
+    # Make any failures easy to spot, since those files are still in place
+    if failed_moves:
+        print(f"⚠️  {len(failed_moves)} file(s) could not be moved:")
+        for filename in failed_moves:
+            print(f"   - {filename}")
+
 
 # This runs when you execute the script
 if __name__ == "__main__":